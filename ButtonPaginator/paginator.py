@@ -1,6 +1,7 @@
 import asyncio
-from typing import List, Optional, Union
+from typing import Coroutine, FrozenSet, List, Optional, Set, Union
 
+import async_timeout
 import discord
 import discord_slash.model
 from discord.ext import commands
@@ -18,8 +19,61 @@ EmojiType = List[
     Union[discord.Emoji, discord.Reaction, discord.PartialEmoji, str]
 ]
 
+_DEFAULT_BASIC = ("⬅", "➡")
+_DEFAULT_EXTENDED = ("⏪", "⏩")
+
+# Seconds to wait for further clicks before editing the message
+_COALESCE_DELAY = 0.15
+
+# Maximum number of clicks buffered between the listener and start()
+_QUEUE_SIZE = 8
+
+_ALLOWED_BOT_TYPES = (
+    discord.Client,
+    discord.AutoShardedClient,
+    commands.Bot,
+    commands.AutoShardedBot,
+)
+
 
 class Paginator:
+    __slots__ = (
+        "bot",
+        "context",
+        "contents",
+        "embeds",
+        "page",
+        "header",
+        "use_extend",
+        "only",
+        "basic_buttons",
+        "extended_buttons",
+        "left_button_style",
+        "right_button_style",
+        "timeout",
+        "delete_after_timeout",
+        "disable_after_timeout",
+        "_left_button",
+        "_right_button",
+        "_left2_button",
+        "_right2_button",
+        "_message",
+        "_shown_page",
+        "_pending_tasks",
+        "_pending_ctx",
+        "_coalesce_task",
+        "_queue",
+        "_only_user_ids",
+        "_only_role_ids",
+        "_pages",
+        "_total",
+        "_page_label_fmt",
+        "_nav",
+        "_buttons",
+        "_refresh_buttons",
+        "_components",
+    )
+
     def __init__(
         self,
         bot: Union[
@@ -68,36 +122,7 @@ class Paginator:
         :param delete_after_timeout: Whether to delete the message after the first sent timeout
         :param disable_after_timeout: Whether to disable the message after the first sent timeout
         """
-        self.bot = bot
-        self.context = ctx
-        self.contents = contents
-        self.embeds = embeds
-        self.page = start_page
-        self.header = header
-        self.use_extend = use_extend
-        self.only = only
-        self.basic_buttons = basic_buttons or ["⬅", "➡"]
-        self.extended_buttons = extended_buttons or ["⏪", "⏩"]
-        self.left_button_style: int = left_button_style
-        self.right_button_style: int = right_button_style
-        self.timeout = timeout
-        self.delete_after_timeout = delete_after_timeout
-        self.disable_after_timeout = disable_after_timeout
-        self._left_button = self.basic_buttons[0]
-        self._right_button = self.basic_buttons[1]
-        self._left2_button = self.extended_buttons[0]
-        self._right2_button = self.extended_buttons[1]
-        self._message: Optional[discord_slash.model.SlashMessage] = None
-
-        if not issubclass(
-            type(bot),
-            (
-                discord.Client,
-                discord.AutoShardedClient,
-                commands.Bot,
-                commands.AutoShardedBot,
-            ),
-        ):
+        if not isinstance(bot, _ALLOWED_BOT_TYPES):
             raise TypeError(
                 "This is not a discord.py related bot class. Must be one of:"
                 " discord.Client, discord.AutoShardedClient, "
@@ -109,48 +134,20 @@ class Paginator:
                 "Both contents and embeds are None."
             )
 
-        if self.only:
-            # Simplify future checks
-            if not isinstance(self.only, list):
-                self.only = [self.only]
-
-            # Check that self.only is a
-            # List[Union[discord.abc.User, discord.Role]]
-            if not all(
-                isinstance(x, (discord.abc.User, discord.role.Role))
-                for x in self.only
-            ):
-                raise TypeError(
-                    "only must be an one of: discord.User, discord.Role, "
-                    "List[Union[discord.User, discord.Role]]"
-                )
-
         # force contents and embeds to be equal lengths
-        if contents is not None and embeds is not None:
-            if len(contents) != len(embeds):
-                raise InvalidArgumentException(
-                    "contents and embeds must be the same length"
-                    " if both are specified"
-                )
-        else:
-            if contents is not None:
-                self.embeds = [None] * len(contents)
-            elif embeds is not None:
-                self.contents = [""] * len(embeds)
+        if (
+            contents is not None
+            and embeds is not None
+            and len(contents) != len(embeds)
+        ):
+            raise InvalidArgumentException(
+                "contents and embeds must be the same length"
+                " if both are specified"
+            )
 
         if not isinstance(timeout, int):
             raise TypeError("timeout must be int.")
 
-        if len(self.basic_buttons) != 2:
-            raise InvalidArgumentException(
-                "There should be 2 elements in basic_buttons."
-            )
-        if extended_buttons is not None:
-            if len(self.extended_buttons) != 2:
-                raise InvalidArgumentException(
-                    "There should be 2 elements in extended_buttons"
-                )
-
         if (
             left_button_style == ButtonStyle.URL
             or right_button_style == ButtonStyle.URL
@@ -159,134 +156,294 @@ class Paginator:
                 "Can't use <discord_component.ButtonStyle.URL> type for button style."
             )
 
+        if basic_buttons and len(basic_buttons) != 2:
+            raise InvalidArgumentException(
+                "There should be 2 elements in basic_buttons."
+            )
+        if extended_buttons and len(extended_buttons) != 2:
+            raise InvalidArgumentException(
+                "There should be 2 elements in extended_buttons"
+            )
+
         if disable_after_timeout and delete_after_timeout:
             raise InvalidArgumentException(
                 "Both disable_after_timeout and delete_after_timeout are enabled. "
                 "Only one of these can be active at a time"
             )
 
-    def button_check(self, ctx: ComponentContext) -> bool:
-        """Return False if the message received isn't the proper message,
-        or if user does not have permissions to interact with message"""
-        if ctx.origin_message_id != self._message.id:
-            return False
-
-        if self.only is not None:
-            check = False
+        if only:
+            # Simplify future checks
+            if not isinstance(only, list):
+                only = [only]
 
-            # Validate that user either:
-            # 1. Is one of the users passed into self.only
-            # 2. Has one of the roles passed into self.only
-            for user in filter(
-                lambda x: isinstance(x, discord.abc.User), self.only
-            ):
-                check = check or user.id == ctx.author_id
-            for role in filter(
-                lambda x: isinstance(x, discord.role.Role), self.only
+            # Check that only is a
+            # List[Union[discord.abc.User, discord.Role]]
+            if not all(
+                isinstance(x, (discord.abc.User, discord.role.Role))
+                for x in only
             ):
-                check = check or role in ctx.author.roles
-
-            if not check:
-                asyncio.get_running_loop().create_task(
-                    ctx.send(
-                        f"{ctx.author.mention}, you do not have permissions "
-                        + "for this interaction!",
-                        hidden=True,
-                    )
+                raise TypeError(
+                    "only must be an one of: discord.User, discord.Role, "
+                    "List[Union[discord.User, discord.Role]]"
                 )
-                return False
 
-        return True
+        contents_len = len(contents) if contents is not None else len(embeds)
 
-    async def start(self) -> None:
-        """Start the paginator.
-        This method will only return if a timeout occurs and `delete_after_timeout` was set to True"""
-        self._message = await self.context.send(
-            content=(self.header + "\n" + self.contents[self.page - 1])
-            or None,
-            embed=self.embeds[self.page - 1],
-            components=(await self._make_buttons()),
-        )
-        while True:
-            try:
-                ctx = await wait_for_component(
-                    self.bot,
-                    check=self.button_check,
-                    messages=self._message,
-                    timeout=self.timeout,
-                )
+        self.bot = bot
+        self.context = ctx
+        self.contents = contents or [""] * contents_len
+        self.embeds = embeds or [None] * contents_len
+        self.page = start_page
+        self.header = header
+        self.use_extend = use_extend
+        self.only = only
+        self.basic_buttons = basic_buttons or _DEFAULT_BASIC
+        self.extended_buttons = extended_buttons or _DEFAULT_EXTENDED
+        self.left_button_style: int = left_button_style
+        self.right_button_style: int = right_button_style
+        self.timeout = timeout
+        self.delete_after_timeout = delete_after_timeout
+        self.disable_after_timeout = disable_after_timeout
+        self._left_button = self.basic_buttons[0]
+        self._right_button = self.basic_buttons[1]
+        self._left2_button = self.extended_buttons[0]
+        self._right2_button = self.extended_buttons[1]
+        self._message: Optional[discord_slash.model.SlashMessage] = None
+        self._pages: List[Optional[str]] = []
+        self._shown_page: Optional[int] = None
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._pending_ctx: Optional[ComponentContext] = None
+        self._coalesce_task: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
 
-                if ctx.custom_id == "_extend_left_click":
-                    self.page = 1
-                elif ctx.custom_id == "_left_click":
-                    self.page = self.page - 1 or 1  # Don't go back too far
-                elif ctx.custom_id == "_right_click":
-                    self.page += self.page != len(
-                        self.embeds
-                    )  # Adding bools ~= adding numbers
-                elif ctx.custom_id == "_extend_right_click":
-                    self.page = len(self.embeds)
-
-                await ctx.edit_origin(
-                    content=(self.header + "\n" + self.contents[self.page - 1])
-                    or None,
-                    embed=self.embeds[self.page - 1],
-                    components=(await self._make_buttons()),
-                )
+        # Split self.only into id sets so button_check is a membership test
+        self._only_user_ids: Optional[FrozenSet[int]] = None
+        self._only_role_ids: Optional[FrozenSet[int]] = None
+        if only is not None:
+            self._only_user_ids = frozenset(
+                x.id for x in only if isinstance(x, discord.abc.User)
+            )
+            self._only_role_ids = frozenset(
+                x.id for x in only if isinstance(x, discord.role.Role)
+            )
 
-            except asyncio.TimeoutError:
-                if self.delete_after_timeout:
-                    return await self._message.delete()
-                elif self.disable_after_timeout:
-                    components = await self._make_buttons()
-                    for row in components:
-                        for component in row["components"]:
-                            component["disabled"] = True
-                    return await self._message.edit(components=components)
-
-    async def _make_buttons(self) -> list:
-        """Create the actionrow used to manage the Paginator"""
-        left_disable = self.page == 1
-        right_disable = self.page == (len(self.embeds or self.contents))
-
-        buttons = [
-            create_button(
-                style=self.left_button_style,
-                label=self._left_button,
-                custom_id="_left_click",
-                disabled=left_disable,
-            ),
-            create_button(
-                style=ButtonStyle.gray,
-                label=f"Page {str(self.page)} / {str(len(self.embeds or self.contents))}",
-                custom_id="_show_page",
-                disabled=True,
-            ),
-            create_button(
-                style=self.right_button_style,
-                label=self._right_button,
-                custom_id="_right_click",
-                disabled=right_disable,
-            ),
-        ]
+        self._total = contents_len
+        self._page_label_fmt = f"Page %d / {self._total}"
 
+        # Map each button's custom_id to the page it navigates to
+        self._nav = {
+            "_extend_left_click": lambda: 1,
+            "_left_click": lambda: max(1, self.page - 1),
+            "_right_click": lambda: self.page + (self.page != self._total),
+            "_extend_right_click": lambda: self._total,
+        }
+
+        # Build the buttons once; navigation only flips their
+        # ``disabled`` flags and the page label in place
+        left = create_button(
+            style=self.left_button_style,
+            label=self._left_button,
+            custom_id="_left_click",
+        )
+        page = create_button(
+            style=ButtonStyle.gray,
+            label=self._page_label_fmt % self.page,
+            custom_id="_show_page",
+            disabled=True,
+        )
+        right = create_button(
+            style=self.right_button_style,
+            label=self._right_button,
+            custom_id="_right_click",
+        )
         if self.use_extend:
-            buttons.insert(
-                0,
+            self._buttons = [
                 create_button(
                     style=self.left_button_style,
                     label=self._left2_button,
                     custom_id="_extend_left_click",
-                    disabled=left_disable,
                 ),
-            )
-            buttons.append(
+                left,
+                page,
+                right,
                 create_button(
                     style=self.right_button_style,
                     label=self._right2_button,
                     custom_id="_extend_right_click",
-                    disabled=right_disable,
-                )
+                ),
+            ]
+            self._refresh_buttons = self._refresh_extended
+        else:
+            self._buttons = [left, page, right]
+            self._refresh_buttons = self._refresh_basic
+        # Refreshing mutates the button dicts, so the same components
+        # list can be passed to every send and edit
+        self._components = [create_actionrow(*self._buttons)]
+
+    def button_check(self, ctx: ComponentContext) -> bool:
+        """Return False if the message received isn't the proper message,
+        or if user does not have permissions to interact with message"""
+        message = self._message
+        if message is None or ctx.origin_message_id != message.id:
+            return False
+
+        # Validate that user either:
+        # 1. Is one of the users passed into self.only
+        # 2. Has one of the roles passed into self.only
+        user_ids = self._only_user_ids
+        if user_ids is None or ctx.author_id in user_ids:
+            return True
+        role_ids = self._only_role_ids
+        if role_ids and any(
+            role.id in role_ids for role in getattr(ctx.author, "roles", ())
+        ):
+            return True
+
+        self._spawn(
+            ctx.send(
+                f"{ctx.author.mention}, you do not have permissions "
+                "for this interaction!",
+                hidden=True,
             )
+        )
+        return False
+
+    async def start(self) -> None:
+        """Start the paginator.
+        This method will only return once a timeout occurs"""
+        # Join the header onto each page once instead of on every edit,
+        # picking up any changes made to header or contents since __init__
+        header = self.header
+        self._pages = [
+            f"{header}\n{content}" if header else (content or None)
+            for content in self.contents
+        ]
+
+        self._refresh_buttons()
+        self._message = await self.context.send(
+            content=self._pages[self.page - 1],
+            embed=self.embeds[self.page - 1],
+            components=self._components,
+        )
+        self._shown_page = self.page
+        if isinstance(self.bot, commands.bot.BotBase):
+            # Register a single listener for the paginator's lifetime
+            # instead of a new one for every click
+            self._queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+            self.bot.add_listener(self._on_component, "on_component")
+        try:
+            while True:
+                try:
+                    ctx = await self._wait_for_click()
+
+                    old_page = self.page
+                    nav = self._nav.get(ctx.custom_id)
+                    if nav is not None:
+                        self.page = nav()
+
+                    if self.page == old_page:
+                        # Nothing to redraw, just acknowledge the click
+                        await ctx.defer(edit_origin=True)
+                        continue
+
+                    await self._schedule_edit(ctx)
+
+                except asyncio.TimeoutError:
+                    if self._coalesce_task is not None:
+                        # Let the last batch of clicks land first
+                        await self._finish_edit()
+                    if self.delete_after_timeout:
+                        await self._message.delete()
+                    elif self.disable_after_timeout:
+                        for button in self._buttons:
+                            button["disabled"] = True
+                        await self._message.edit(components=self._components)
+                    return
+        finally:
+            if self._queue is not None:
+                self.bot.remove_listener(self._on_component, "on_component")
+
+    async def _on_component(self, ctx: ComponentContext) -> None:
+        """Queue valid clicks on the paginator for start() to handle"""
+        if not self.button_check(ctx):
+            return
+        try:
+            self._queue.put_nowait(ctx)
+        except asyncio.QueueFull:
+            await ctx.defer(edit_origin=True)
+
+    async def _wait_for_click(self) -> ComponentContext:
+        """Wait for the next valid click on the paginator"""
+        if self._queue is None:
+            return await wait_for_component(
+                self.bot,
+                check=self.button_check,
+                messages=self._message,
+                timeout=self.timeout,
+            )
+        async with async_timeout.timeout(self.timeout):
+            return await self._queue.get()
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Run `coro` in the background, keeping a reference to the task
+        until it finishes so it can't be garbage collected early"""
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    async def _schedule_edit(self, ctx: ComponentContext) -> None:
+        """Edit the message shortly, folding in any clicks that arrive
+        in the meantime so a burst of clicks costs a single edit"""
+        if self._coalesce_task is not None:
+            if self._pending_ctx is not None:
+                # Still waiting out the delay; superseded interactions
+                # still need an acknowledgement
+                self._coalesce_task.cancel()
+                self._spawn(self._pending_ctx.defer(edit_origin=True))
+            else:
+                # The previous edit already started, let it land first
+                await self._finish_edit()
+
+        self._pending_ctx = ctx
+        self._coalesce_task = self._spawn(self._flush_after(_COALESCE_DELAY))
+
+    async def _flush_after(self, delay: float) -> None:
+        """Wait for `delay` seconds, then show the current page"""
+        await asyncio.sleep(delay)
+        ctx = self._pending_ctx
+        self._pending_ctx = None
+        page = self.page
+        if page == self._shown_page:
+            # The clicks ended on the page already on screen
+            await ctx.defer(edit_origin=True)
+            return
+
+        self._refresh_buttons()
+        await ctx.edit_origin(
+            content=self._pages[page - 1],
+            embed=self.embeds[page - 1],
+            components=self._components,
+        )
+        self._shown_page = page
+
+    async def _finish_edit(self) -> None:
+        """Wait for the scheduled edit, raising any error it ran into"""
+        try:
+            await self._coalesce_task
+        finally:
+            self._coalesce_task = None
+
+    def _refresh_basic(self) -> None:
+        """Update the cached actionrow used to manage the Paginator"""
+        left, page, right = self._buttons
+        left["disabled"] = self.page == 1
+        right["disabled"] = self.page == self._total
+        page["label"] = self._page_label_fmt % self.page
 
-        return [create_actionrow(*buttons)]
+    def _refresh_extended(self) -> None:
+        """Update the cached actionrow, including the first/last buttons"""
+        extend_left, left, page, right, extend_right = self._buttons
+        extend_left["disabled"] = left["disabled"] = self.page == 1
+        extend_right["disabled"] = right["disabled"] = self.page == self._total
+        page["label"] = self._page_label_fmt % self.page
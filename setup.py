@@ -12,7 +12,7 @@ setup(
     packages=find_packages(),
     keywords=["discord.py", "paginaion", "button", "components", "discord_components"],
     python_requires=">=3.6",
-    install_requires=["discord.py"],
+    install_requires=["discord.py", "async-timeout"],
     zip_safe=False,
     classifiers=[
         "Programming Language :: Python :: 3",